@@ -1,18 +1,40 @@
-import React, { useState, useCallback, useRef } from 'react'
+import React, { useState, useCallback, useRef, useMemo } from 'react'
 
 const anthropic_base_url = import.meta.env.ANTHROPIC_BASE_URL || "anthropic.com";
 
+// SSE markers matched against the raw response body
+const SSE_DATA_PREFIX = 'data: '
+const SSE_DATA_LINE = '\n' + SSE_DATA_PREFIX
+const SSE_PING_EVENT = '{"type": "ping"}'
+
+// Number of request cards rendered at a time
+const PAGE_SIZE = 50
+
 const LogFileViewer = () => {
   const [logData, setLogData] = useState([])
   const [expandedItems, setExpandedItems] = useState(new Set())
   const [isDragOver, setIsDragOver] = useState(false)
   const [currentFileName, setCurrentFileName] = useState('')
   const [selectedModels, setSelectedModels] = useState(new Set())
+  const [visibleCount, setVisibleCount] = useState(PAGE_SIZE)
   const fileInputRef = useRef(null)
 
-  // Parse timestamp string to Date object
+  // Parse timestamp string to Date object (ISO strings with a trailing Z parse natively)
   const parseTimestamp = (timestampStr) => {
-    return new Date(timestampStr.replace('Z', '+00:00'))
+    return new Date(timestampStr)
+  }
+
+  // Join the text parts of message content, which is either a string or an array of parts
+  const joinTextParts = (content) => {
+    if (typeof content === 'string') return content
+    if (!Array.isArray(content)) return ''
+    let text = null
+    for (const part of content) {
+      if (part?.type === 'text') {
+        text = text === null ? (part.text || '') : text + ' ' + (part.text || '')
+      }
+    }
+    return text || ''
   }
 
   // Extract API data from log entry
@@ -33,88 +55,93 @@ const LogFileViewer = () => {
     let outputTokens = null
     let cachedInputTokens = null
     let cacheCreationInputTokens = null
-    let assistantMessage = ''
+    const assistantParts = []
     let toolCalls = []
     let currentToolCall = null
     
     if (typeof responseBody === 'string' && responseBody.includes('message_start')) {
-      const lines = responseBody.split('\n')
-      for (const line of lines) {
-        if (line.startsWith('data: ')) {
-          try {
-            const dataStr = line.slice(6).trim()
-            if (!dataStr || dataStr.startsWith('{"type": "ping"}')) {
-              continue
-            }
-            const data = JSON.parse(dataStr)
-            
-            // Extract usage info from message_start event
-            if (data.type === 'message_start' && data.message) {
-              const usage = data.message.usage || {}
-              inputTokens = usage.input_tokens
-              outputTokens = usage.output_tokens
-              cachedInputTokens = usage.cache_read_input_tokens
-              cacheCreationInputTokens = usage.cache_creation_input_tokens
-            }
+      // Jump between "data: " lines with indexOf instead of splitting the whole body
+      const findNextData = (from) => {
+        const newline = responseBody.indexOf(SSE_DATA_LINE, from)
+        return newline === -1 ? -1 : newline + SSE_DATA_LINE.length
+      }
+      let dataStart = responseBody.startsWith(SSE_DATA_PREFIX) ? SSE_DATA_PREFIX.length : findNextData(0)
+      while (dataStart !== -1) {
+        let lineEnd = responseBody.indexOf('\n', dataStart)
+        if (lineEnd === -1) lineEnd = responseBody.length
+        // JSON.parse tolerates surrounding whitespace, so the payload is not trimmed
+        const dataStr = responseBody.slice(dataStart, lineEnd)
+        dataStart = findNextData(lineEnd)
+
+        try {
+          if (!dataStr || dataStr.startsWith(SSE_PING_EVENT)) {
+            continue
+          }
+          const data = JSON.parse(dataStr)
             
-            // Extract message content from text deltas
-            else if (data.type === 'content_block_delta' && data.delta?.text) {
-              assistantMessage += data.delta.text
-            }
+          // Extract usage info from message_start event
+          if (data.type === 'message_start' && data.message) {
+            const usage = data.message.usage || {}
+            inputTokens = usage.input_tokens
+            outputTokens = usage.output_tokens
+            cachedInputTokens = usage.cache_read_input_tokens
+            cacheCreationInputTokens = usage.cache_creation_input_tokens
+          }
             
-            // Handle tool use content blocks
-            else if (data.type === 'content_block_start' && data.content_block?.type === 'tool_use') {
-              currentToolCall = {
-                id: data.content_block.id,
-                name: data.content_block.name,
-                input: ''
-              }
-            }
+          // Extract message content from text deltas
+          else if (data.type === 'content_block_delta' && data.delta?.text) {
+            assistantParts.push(data.delta.text)
+          }
             
-            // Handle tool use partial JSON
-            else if (data.type === 'content_block_delta' && data.delta?.partial_json && currentToolCall) {
-              currentToolCall.input += data.delta.partial_json
+          // Handle tool use content blocks
+          else if (data.type === 'content_block_start' && data.content_block?.type === 'tool_use') {
+            currentToolCall = {
+              id: data.content_block.id,
+              name: data.content_block.name,
+              inputParts: []
             }
+          }
             
-            // Complete tool call
-            else if (data.type === 'content_block_stop' && currentToolCall) {
-              try {
-                currentToolCall.input = JSON.parse(currentToolCall.input)
-              } catch (e) {
-                // Keep as string if parsing fails
-              }
-              toolCalls.push(currentToolCall)
-              currentToolCall = null
-            }
+          // Handle tool use partial JSON
+          else if (data.type === 'content_block_delta' && data.delta?.partial_json && currentToolCall) {
+            currentToolCall.inputParts.push(data.delta.partial_json)
+          }
             
-            // Update output tokens from message_delta
-            else if (data.type === 'message_delta' && data.usage) {
-              outputTokens = data.usage.output_tokens
+          // Complete tool call
+          else if (data.type === 'content_block_stop' && currentToolCall) {
+            const { inputParts, ...toolCall } = currentToolCall
+            toolCall.input = inputParts.join('')
+            try {
+              toolCall.input = JSON.parse(toolCall.input)
+            } catch (e) {
+              // Keep as string if parsing fails
             }
+            toolCalls.push(toolCall)
+            currentToolCall = null
+          }
             
-          } catch (e) {
-            continue
+          // Update output tokens from message_delta
+          else if (data.type === 'message_delta' && data.usage) {
+            outputTokens = data.usage.output_tokens
           }
+            
+        } catch (e) {
+          continue
         }
       }
     }
 
+    const assistantMessage = assistantParts.join('')
+
     const messages = requestBody.messages || []
-    const userMessages = messages.filter(msg => msg.role === 'user')
     
-    let lastUserMessage = ''
-    if (userMessages.length > 0) {
-      const lastMsg = userMessages[userMessages.length - 1]
-      const content = lastMsg.content || ''
-      if (typeof content === 'string') {
-        lastUserMessage = content
-      } else if (Array.isArray(content)) {
-        const textParts = content
-          .filter(part => typeof part === 'object' && part.type === 'text')
-          .map(part => part.text || '')
-        lastUserMessage = textParts.join(' ')
-      }
+    // Walk back to the last user message rather than filtering every message
+    let lastUserIndex = messages.length - 1
+    while (lastUserIndex >= 0 && messages[lastUserIndex].role !== 'user') {
+      lastUserIndex--
     }
+    
+    const lastUserMessage = lastUserIndex >= 0 ? joinTextParts(messages[lastUserIndex].content) : ''
 
     const systemPrompt = requestBody.system || []
     const tools = requestBody.tools || []
@@ -188,12 +215,17 @@ const LogFileViewer = () => {
   // Parse log file
   const parseLogFile = async (file) => {
     const text = await file.text()
-    const lines = text.trim().split('\n')
     const apiRequests = []
 
-    for (const line of lines) {
-      if (!line.trim()) continue
-      
+    // Slice one line at a time instead of copying the file into a line array
+    let lineStart = 0
+    while (lineStart < text.length) {
+      let lineEnd = text.indexOf('\n', lineStart)
+      if (lineEnd === -1) lineEnd = text.length
+      const line = text.slice(lineStart, lineEnd)
+      lineStart = lineEnd + 1
+
+      // JSON.parse tolerates surrounding whitespace, so blank lines are only checked on failure
       try {
         const logEntry = JSON.parse(line)
         const apiData = extractApiData(logEntry)
@@ -201,7 +233,9 @@ const LogFileViewer = () => {
           apiRequests.push(apiData)
         }
       } catch (e) {
-        console.warn('Could not parse line:', e)
+        if (line.trim()) {
+          console.warn('Could not parse line:', e)
+        }
       }
     }
 
@@ -318,24 +352,32 @@ const LogFileViewer = () => {
     return text.length > maxLength ? text.substring(0, maxLength) + '...' : text
   }
 
-  // Get unique models from log data
-  const getUniqueModels = () => {
+  // Summary totals and unique models in one pass, recomputed only when the log changes
+  const summary = useMemo(() => {
+    let totalInputTokens = 0
+    let totalOutputTokens = 0
     const models = new Set()
-    logData.forEach(item => {
+    for (const item of logData) {
+      totalInputTokens += item.inputTokens || 0
+      totalOutputTokens += item.outputTokens || 0
       if (item.model) {
         models.add(item.model)
       }
-    })
-    return Array.from(models).sort()
-  }
+    }
+    return {
+      totalInputTokens,
+      totalOutputTokens,
+      uniqueModels: Array.from(models).sort()
+    }
+  }, [logData])
 
   // Filter log data based on selected models
-  const getFilteredData = () => {
+  const filteredData = useMemo(() => {
     if (selectedModels.size === 0) {
       return logData
     }
     return logData.filter(item => selectedModels.has(item.model))
-  }
+  }, [logData, selectedModels])
 
   // Toggle model selection
   const toggleModelSelection = (model) => {
@@ -760,6 +802,7 @@ const LogFileViewer = () => {
     setCurrentFileName('')
     setExpandedItems(new Set())
     setSelectedModels(new Set())
+    setVisibleCount(PAGE_SIZE)
   }
 
   const scrollToTop = () => {
@@ -818,16 +861,16 @@ const LogFileViewer = () => {
           <div className="bg-white p-5 rounded-lg shadow-sm mb-5">
             <h2 className="text-xl font-semibold text-gray-800 mb-3">Summary</h2>
             <p className="mb-2">Total requests: {logData.length}</p>
-            <p className="mb-2">Total input tokens: {formatTokens(logData.reduce((sum, item) => sum + (item.inputTokens || 0), 0))}</p>
-            <p>Total output tokens: {formatTokens(logData.reduce((sum, item) => sum + (item.outputTokens || 0), 0))}</p>
+            <p className="mb-2">Total input tokens: {formatTokens(summary.totalInputTokens)}</p>
+            <p>Total output tokens: {formatTokens(summary.totalOutputTokens)}</p>
           </div>
 
           {/* Model Filter Section */}
-          {getUniqueModels().length > 1 && (
+          {summary.uniqueModels.length > 1 && (
             <div className="bg-white p-5 rounded-lg shadow-sm mb-5">
               <h2 className="text-xl font-semibold text-gray-800 mb-3">Filter by Models</h2>
               <div className="flex flex-wrap gap-2">
-                {getUniqueModels().map(model => (
+                {summary.uniqueModels.map(model => (
                   <button
                     key={model}
                     onClick={() => toggleModelSelection(model)}
@@ -845,7 +888,7 @@ const LogFileViewer = () => {
               {selectedModels.size > 0 && (
                 <div className="mt-3 flex items-center gap-2">
                   <span className="text-sm text-gray-600">
-                    Showing {getFilteredData().length} of {logData.length} requests
+                    Showing {filteredData.length} of {logData.length} requests
                   </span>
                   <button
                     onClick={() => setSelectedModels(new Set())}
@@ -859,7 +902,7 @@ const LogFileViewer = () => {
           )}
 
           <div className="space-y-4">
-            {getFilteredData().map((item, index) => (
+            {filteredData.slice(0, visibleCount).map((item, index) => (
               <div key={item.id} className="bg-white rounded-lg shadow-sm overflow-hidden hover:shadow-md transition-shadow duration-200">
                 <div 
                   className="p-4 cursor-pointer bg-gray-50 border-b border-gray-200 hover:bg-gray-100 transition-colors duration-200"
@@ -869,7 +912,7 @@ const LogFileViewer = () => {
                   <div className="flex justify-between items-center mb-3">
                     <div className="flex flex-wrap gap-5 items-center">
                       <span className="font-bold text-gray-800 bg-gray-200 px-3 py-1 rounded-full text-sm">
-                        #{index + 1} of {getFilteredData().length}
+                        #{index + 1} of {filteredData.length}
                       </span>
                       <span className="font-semibold text-blue-600">{item.model}</span>
                       <span className="text-gray-600 text-sm">
@@ -1033,6 +1076,17 @@ const LogFileViewer = () => {
               </div>
             ))}
           </div>
+
+          {filteredData.length > visibleCount && (
+            <div className="mt-5 text-center">
+              <button
+                onClick={() => setVisibleCount(visibleCount + PAGE_SIZE)}
+                className="bg-blue-600 hover:bg-blue-700 text-white px-4 py-2 rounded-lg text-sm font-medium transition-colors duration-200"
+              >
+                Show more ({filteredData.length - visibleCount} remaining)
+              </button>
+            </div>
+          )}
         </div>
       )}
 